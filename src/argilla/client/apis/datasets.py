@@ -126,7 +126,8 @@ class Datasets(AbstractApi):
 
     def find_by_name(self, name: str) -> _DatasetApiModel:
         dataset = get_dataset(self.http_client, name=name).parsed
-        return self._DatasetApiModel.parse_obj(dataset)
+        # The sdk layer already validated the response, so there's no need to validate it again
+        return self._DatasetApiModel.construct(**dataset.dict())
 
     def create(self, name: str, workspace: str, settings: Settings):
         task = (
@@ -141,18 +141,6 @@ class Client(_ClientCommonDefaults, _Client):
         )
         return build_raw_response(response).parsed
 
-    @with_httpx_error_handler
-    def patch(self, path: str, *args, **kwargs):
-        path = self._normalize_path(path)
-
-        response = self.__httpx__.patch(
-            url=path,
-            headers=self.get_headers(),
-            *args,
-            **kwargs,
-        )
-        return build_raw_response(response).parsed
-
     @with_httpx_error_handler
     def patch(
         self,
@@ -28,6 +28,20 @@ from argilla.client.sdk.commons.errors import (
     ValidationApiError,
 )
 
+_ERROR_TYPE_BY_STATUS = {
+    error_type.HTTP_STATUS: error_type
+    for error_type in [
+        BadRequestApiError,
+        UnauthorizedApiError,
+        AlreadyExistsApiError,
+        ForbiddenApiError,
+        NotFoundApiError,
+        ValidationApiError,
+        MethodNotAllowedApiError,
+        GenericApiError,
+    ]
+}
+
 
 def handle_response_error(response: httpx.Response, parse_response: bool = True, **client_ctx):
     try:
@@ -41,23 +55,9 @@ def handle_response_error(response: httpx.Response, parse_response: bool = True,
 
     error_args = error_detail if error_detail else response_content
 
-    if response.status_code == BadRequestApiError.HTTP_STATUS:
-        error_type = BadRequestApiError
-    elif response.status_code == UnauthorizedApiError.HTTP_STATUS:
-        error_type = UnauthorizedApiError
-    elif response.status_code == AlreadyExistsApiError.HTTP_STATUS:
-        error_type = AlreadyExistsApiError
-    elif response.status_code == ForbiddenApiError.HTTP_STATUS:
-        error_type = ForbiddenApiError
-    elif response.status_code == NotFoundApiError.HTTP_STATUS:
-        error_type = NotFoundApiError
-    elif response.status_code == ValidationApiError.HTTP_STATUS:
-        error_type = ValidationApiError
-        error_args["client_ctx"] = client_ctx
-    elif response.status_code == MethodNotAllowedApiError.HTTP_STATUS:
-        error_type = MethodNotAllowedApiError
-    elif response.status_code == GenericApiError.HTTP_STATUS:
-        error_type = GenericApiError
-    else:
+    error_type = _ERROR_TYPE_BY_STATUS.get(response.status_code)
+    if error_type is None:
         raise HttpResponseError(response=response)
+    if error_type is ValidationApiError:
+        error_args["client_ctx"] = client_ctx
     raise error_type(**error_args)
@@ -12,11 +12,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from functools import lru_cache
-from typing import Union
+import time
+from typing import Dict, Optional, Tuple, Union
 
 import httpx
 
+from argilla._constants import WORKSPACE_HEADER_NAME
 from argilla.client.sdk.client import AuthenticatedClient
 from argilla.client.sdk.commons.errors_handler import handle_response_error
 from argilla.client.sdk.commons.models import (
@@ -26,22 +27,57 @@ from argilla.client.sdk.commons.models import (
 )
 from argilla.client.sdk.datasets.models import CopyDatasetRequest, Dataset
 
+_DatasetCacheKey = Tuple[str, Optional[str], str]
+
+# Seconds a fetched dataset is served from the local cache before it is requested again
+_CACHE_TTL = 30.0
+_CACHE_MAX_SIZE = 512
+_DATASETS_CACHE: Dict[_DatasetCacheKey, Tuple[float, Response[Dataset]]] = {}
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
 
-@lru_cache(maxsize=None)
 def get_dataset(
     client: AuthenticatedClient,
     name: str,
 ) -> Response[Dataset]:
-    url = "{}/api/datasets/{name}".format(client.base_url, name=name)
+    # The api key is left out of the cache key, so rotated credentials don't pin stale entries
+    key = (client.base_url, client.headers.get(WORKSPACE_HEADER_NAME), name)
+    now = time.monotonic()
 
-    response = httpx.get(
-        url=url,
+    cached = _DATASETS_CACHE.get(key)
+    if cached is not None and now - cached[0] < _CACHE_TTL:
+        _CACHE_STATS["hits"] += 1
+        return cached[1]
+    _CACHE_STATS["misses"] += 1
+
+    # Going through the client connection pool reuses kept-alive connections between lookups
+    response = client.__httpx__.get(
+        url=f"api/datasets/{name}",
         headers=client.get_headers(),
         cookies=client.get_cookies(),
         timeout=client.get_timeout(),
     )
 
-    return _build_response(response=response, name=name)
+    response = _build_response(response=response, name=name)
+
+    _DATASETS_CACHE.pop(key, None)
+    _DATASETS_CACHE[key] = (now, response)
+    if len(_DATASETS_CACHE) > _CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        _DATASETS_CACHE.pop(next(iter(_DATASETS_CACHE)))
+
+    return response
+
+
+def clear_datasets_cache():
+    """Drops all the locally cached datasets and resets the cache stats"""
+    _DATASETS_CACHE.clear()
+    _CACHE_STATS.update(hits=0, misses=0)
+
+
+def get_datasets_cache_stats() -> Dict[str, int]:
+    """Returns the hits, misses and current size of the local datasets cache"""
+    return {**_CACHE_STATS, "size": len(_DATASETS_CACHE)}
 
 
 def copy_dataset(
@@ -76,7 +112,7 @@ def delete_dataset(
     )
     # If everything was ok, we must clear local cache data
     if 200 <= response.status_code < 400:
-        get_dataset.cache_clear()
+        clear_datasets_cache()
         return Response(
             status_code=response.status_code,
             content=response.content,
@@ -87,12 +123,12 @@ def delete_dataset(
 
 
 def _build_response(response: httpx.Response, name: str) -> Response[Union[Dataset, ErrorMessage, HTTPValidationError]]:
-    if response.status_code == 200:
-        parsed_response = Dataset(**response.json())
-        return Response(
-            status_code=response.status_code,
-            content=response.content,
-            headers=response.headers,
-            parsed=parsed_response,
-        )
-    return handle_response_error(response, dataset=name)
+    if response.status_code != 200:
+        return handle_response_error(response, dataset=name)
+
+    return Response(
+        status_code=response.status_code,
+        content=response.content,
+        headers=response.headers,
+        parsed=Dataset.parse_raw(response.content),
+    )
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import datetime
+from functools import lru_cache
 from typing import List
 
 import argilla
@@ -34,29 +35,44 @@ from argilla.client.sdk.token_classification.models import (
 from argilla.server.daos.backend.client_adapters.factory import ClientAdapterFactory
 from argilla.server.settings import settings
 
-try:
-    client = ClientAdapterFactory.get(
-        hosts=settings.elasticsearch,
-        index_shards=settings.es_records_index_shards,
-        ssl_verify=settings.elasticsearch_ssl_verify,
-        ca_path=settings.elasticsearch_ca_path,
-    )
+_T_2000_01 = datetime.datetime(2000, 1, 1)
+_T_2000_02 = datetime.datetime(2000, 2, 1)
+_T_2000_03 = datetime.datetime(2000, 3, 1)
+_MOCK_METADATA = {"mock_metadata": "mock"}
+
+
+@lru_cache(maxsize=1)
+def is_vector_search_supported() -> bool:
+    # The backend is only probed the first time it's needed, not when this module is imported
+    try:
+        client = ClientAdapterFactory.get(
+            hosts=settings.elasticsearch,
+            index_shards=settings.es_records_index_shards,
+            ssl_verify=settings.elasticsearch_ssl_verify,
+            ca_path=settings.elasticsearch_ca_path,
+        )
+
+        return client.vector_search_supported
+    except Exception:
+        return False
 
-    SUPPORTED_VECTOR_SEARCH = client.vector_search_supported
-except Exception:
-    SUPPORTED_VECTOR_SEARCH = False
+
+def _reset_and_load(client, dataset: str, task: TaskType, bulk_data: str) -> str:
+    client.delete(f"/api/datasets/{dataset}")
+    client.post(f"/api/datasets/{dataset}/{task}:bulk", data=bulk_data)
+
+    return dataset
 
 
 @pytest.fixture(scope="session")
 def supported_vector_search() -> bool:
-    return SUPPORTED_VECTOR_SEARCH
+    return is_vector_search_supported()
 
 
-@pytest.fixture
-def gutenberg_spacy_ner(mocked_client):
+@pytest.fixture(scope="session")
+def gutenberg_spacy_ner_records() -> argilla.DatasetForTokenClassification:
     from datasets import load_dataset
 
-    dataset = "gutenberg_spacy_ner"
     dataset_ds = load_dataset(
         "argilla/gutenberg_spacy-ner",
         split="train",
@@ -64,10 +80,15 @@ def gutenberg_spacy_ner(mocked_client):
         revision="fff5f572e4cc3127f196f46ba3f9914c6fd0d763",
     )
 
-    dataset_rb = argilla.read_datasets(dataset_ds, task="TokenClassification")
+    return argilla.read_datasets(dataset_ds, task="TokenClassification")
+
+
+@pytest.fixture
+def gutenberg_spacy_ner(mocked_client, gutenberg_spacy_ner_records):
+    dataset = "gutenberg_spacy_ner"
 
     argilla.delete(dataset)
-    argilla.log(name=dataset, records=dataset_rb)
+    argilla.log(name=dataset, records=gutenberg_spacy_ner_records, batch_size=1000, verbose=False)
 
     return dataset
 
@@ -84,8 +105,8 @@ def singlelabel_textclassification_records(
             annotation="a",
             annotation_agent="mock_aagent",
             id=1,
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
             explanation={"text": [rg.TokenAttributions(token="mock", attributions={"a": 0.1, "b": 0.5})]},
             status="Validated",
         ),
@@ -94,7 +115,7 @@ def singlelabel_textclassification_records(
             prediction=[("a", 0.5), ("b", 0.2)],
             prediction_agent="mock2_pagent",
             id=2,
-            event_timestamp=datetime.datetime(2000, 2, 1),
+            event_timestamp=_T_2000_02,
             metadata={"mock2_metadata": "mock2"},
             explanation={"text": [rg.TokenAttributions(token="mock2", attributions={"a": 0.7, "b": 0.2})]},
             status="Default",
@@ -111,8 +132,8 @@ def singlelabel_textclassification_records(
             annotation="a",
             annotation_agent="mock_aagent",
             id="a",
-            event_timestamp=datetime.datetime(2000, 3, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_03,
+            metadata=_MOCK_METADATA,
         ),
         rg.TextClassificationRecord(
             text="mock",
@@ -123,29 +144,30 @@ def singlelabel_textclassification_records(
     ]
 
 
+@pytest.fixture(scope="session")
+def singlelabel_textclassification_bulk_data(singlelabel_textclassification_records) -> str:
+    return TextClassificationBulkData(
+        tags={
+            "env": "test",
+            "task": TaskType.text_classification,
+            "multi_label": False,
+        },
+        records=[CreationTextClassificationRecord.from_client(rec) for rec in singlelabel_textclassification_records],
+    ).json(by_alias=True)
+
+
 @pytest.fixture
 def log_singlelabel_textclassification_records(
     mocked_client,
-    singlelabel_textclassification_records,
+    singlelabel_textclassification_bulk_data,
 ) -> str:
-    dataset_name = "singlelabel_textclassification_records"
-    mocked_client.delete(f"/api/datasets/{dataset_name}")
-    mocked_client.post(
-        f"/api/datasets/{dataset_name}/{TaskType.text_classification}:bulk",
-        json=TextClassificationBulkData(
-            tags={
-                "env": "test",
-                "task": TaskType.text_classification,
-                "multi_label": False,
-            },
-            records=[
-                CreationTextClassificationRecord.from_client(rec) for rec in singlelabel_textclassification_records
-            ],
-        ).dict(by_alias=True),
+    return _reset_and_load(
+        mocked_client,
+        dataset="singlelabel_textclassification_records",
+        task=TaskType.text_classification,
+        bulk_data=singlelabel_textclassification_bulk_data,
     )
 
-    return dataset_name
-
 
 @pytest.fixture(scope="session")
 def multilabel_textclassification_records(request) -> List[rg.TextClassificationRecord]:
@@ -158,8 +180,8 @@ def multilabel_textclassification_records(request) -> List[rg.TextClassification
             annotation_agent="mock_aagent",
             multi_label=True,
             id=1,
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
             explanation={"text": [rg.TokenAttributions(token="mock", attributions={"a": 0.1, "b": 0.5})]},
             status="Validated",
         ),
@@ -169,7 +191,7 @@ def multilabel_textclassification_records(request) -> List[rg.TextClassification
             prediction_agent="mock2_pagent",
             multi_label=True,
             id=2,
-            event_timestamp=datetime.datetime(2000, 2, 1),
+            event_timestamp=_T_2000_02,
             metadata={"mock2_metadata": "mock2"},
             explanation={"text": [rg.TokenAttributions(token="mock2", attributions={"a": 0.7, "b": 0.2})]},
             status="Default",
@@ -188,8 +210,8 @@ def multilabel_textclassification_records(request) -> List[rg.TextClassification
             annotation_agent="mock_aagent",
             multi_label=True,
             id="a",
-            event_timestamp=datetime.datetime(2000, 3, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_03,
+            metadata=_MOCK_METADATA,
             metrics={},
         ),
         rg.TextClassificationRecord(
@@ -202,30 +224,30 @@ def multilabel_textclassification_records(request) -> List[rg.TextClassification
     ]
 
 
+@pytest.fixture(scope="session")
+def multilabel_textclassification_bulk_data(multilabel_textclassification_records) -> str:
+    return TextClassificationBulkData(
+        tags={
+            "env": "test",
+            "task": TaskType.text_classification,
+            "multi_label": True,
+        },
+        records=[CreationTextClassificationRecord.from_client(rec) for rec in multilabel_textclassification_records],
+    ).json(by_alias=True)
+
+
 @pytest.fixture
 def log_multilabel_textclassification_records(
     mocked_client,
-    multilabel_textclassification_records,
+    multilabel_textclassification_bulk_data,
 ) -> str:
-    dataset_name = "multilabel_textclassification_records"
-    mocked_client.delete(f"/api/datasets/{dataset_name}")
-
-    mocked_client.post(
-        f"/api/datasets/{dataset_name}/{TaskType.text_classification}:bulk",
-        json=TextClassificationBulkData(
-            tags={
-                "env": "test",
-                "task": TaskType.text_classification,
-                "multi_label": True,
-            },
-            records=[
-                CreationTextClassificationRecord.from_client(rec) for rec in multilabel_textclassification_records
-            ],
-        ).dict(by_alias=True),
+    return _reset_and_load(
+        mocked_client,
+        dataset="multilabel_textclassification_records",
+        task=TaskType.text_classification,
+        bulk_data=multilabel_textclassification_bulk_data,
     )
 
-    return dataset_name
-
 
 @pytest.fixture(scope="session")
 def tokenclassification_records(request) -> List[rg.TokenClassificationRecord]:
@@ -238,8 +260,8 @@ def tokenclassification_records(request) -> List[rg.TokenClassificationRecord]:
             annotation=[("a", 5, 7)],
             annotation_agent="mock_aagent",
             id=1,
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
             status="Validated",
         ),
         rg.TokenClassificationRecord(
@@ -248,8 +270,8 @@ def tokenclassification_records(request) -> List[rg.TokenClassificationRecord]:
             prediction=[("a", 5, 7), ("b", 8, 9)],
             prediction_agent="mock_pagent",
             id=2,
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
         ),
         rg.TokenClassificationRecord(
             text="This is a secondd example",
@@ -265,8 +287,8 @@ def tokenclassification_records(request) -> List[rg.TokenClassificationRecord]:
             annotation=[("a", 0, 4), ("b", 16, 23)],
             annotation_agent="mock_pagent",
             id="a",
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
             metrics={},
         ),
         rg.TokenClassificationRecord(
@@ -279,27 +301,29 @@ def tokenclassification_records(request) -> List[rg.TokenClassificationRecord]:
     ]
 
 
+@pytest.fixture(scope="session")
+def tokenclassification_bulk_data(tokenclassification_records) -> str:
+    return TokenClassificationBulkData(
+        tags={
+            "env": "test",
+            "task": TaskType.token_classification,
+        },
+        records=[CreationTokenClassificationRecord.from_client(rec) for rec in tokenclassification_records],
+    ).json(by_alias=True)
+
+
 @pytest.fixture
 def log_tokenclassification_records(
     mocked_client,
-    tokenclassification_records,
+    tokenclassification_bulk_data,
 ) -> str:
-    dataset_name = "tokenclassification_records"
-    mocked_client.delete(f"/api/datasets/{dataset_name}")
-
-    mocked_client.post(
-        f"/api/datasets/{dataset_name}/{TaskType.token_classification}:bulk",
-        json=TokenClassificationBulkData(
-            tags={
-                "env": "test",
-                "task": TaskType.token_classification,
-            },
-            records=[CreationTokenClassificationRecord.from_client(rec) for rec in tokenclassification_records],
-        ).dict(by_alias=True),
+    return _reset_and_load(
+        mocked_client,
+        dataset="tokenclassification_records",
+        task=TaskType.token_classification,
+        bulk_data=tokenclassification_bulk_data,
     )
 
-    return dataset_name
-
 
 @pytest.fixture(scope="session")
 def text2text_records(request) -> List[rg.Text2TextRecord]:
@@ -311,8 +335,8 @@ def text2text_records(request) -> List[rg.Text2TextRecord]:
             annotation="C'est une baguette",
             annotation_agent="mock_aagent",
             id=1,
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
             status="Validated",
         ),
         rg.Text2TextRecord(
@@ -320,16 +344,16 @@ def text2text_records(request) -> List[rg.Text2TextRecord]:
             prediction=[("Das ist ein Beispiell", 0.9), ("Esto es un ejemploo", 0.1)],
             prediction_agent="mock_pagent",
             id=2,
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
         ),
         rg.Text2TextRecord(
             text="This is a second example",
             prediction=["Esto es un ejemplooo", ("Das ist ein Beispielll", 0.9)],
             prediction_agent="mock_pagent",
             id=3,
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
             metrics={},
         ),
         rg.Text2TextRecord(
@@ -337,8 +361,8 @@ def text2text_records(request) -> List[rg.Text2TextRecord]:
             annotation="C'est une très bonne baguette",
             annotation_agent="mock_pagent",
             id="a",
-            event_timestamp=datetime.datetime(2000, 1, 1),
-            metadata={"mock_metadata": "mock"},
+            event_timestamp=_T_2000_01,
+            metadata=_MOCK_METADATA,
             metrics={},
         ),
         rg.Text2TextRecord(
@@ -350,23 +374,25 @@ def text2text_records(request) -> List[rg.Text2TextRecord]:
     ]
 
 
+@pytest.fixture(scope="session")
+def text2text_bulk_data(text2text_records) -> str:
+    return Text2TextBulkData(
+        tags={
+            "env": "test",
+            "task": TaskType.text2text,
+        },
+        records=[CreationText2TextRecord.from_client(rec) for rec in text2text_records],
+    ).json(by_alias=True)
+
+
 @pytest.fixture
 def log_text2text_records(
     mocked_client,
-    text2text_records,
+    text2text_bulk_data,
 ) -> str:
-    dataset_name = "text2text_records"
-    mocked_client.delete(f"/api/datasets/{dataset_name}")
-
-    mocked_client.post(
-        f"/api/datasets/{dataset_name}/{TaskType.text2text}:bulk",
-        json=Text2TextBulkData(
-            tags={
-                "env": "test",
-                "task": TaskType.text2text,
-            },
-            records=[CreationText2TextRecord.from_client(rec) for rec in text2text_records],
-        ).dict(by_alias=True),
+    return _reset_and_load(
+        mocked_client,
+        dataset="text2text_records",
+        task=TaskType.text2text,
+        bulk_data=text2text_bulk_data,
     )
-
-    return dataset_name
@@ -14,13 +14,14 @@
 #  limitations under the License.
 import httpx
 import pytest
-from argilla._constants import DEFAULT_API_KEY
+from argilla._constants import DEFAULT_API_KEY, WORKSPACE_HEADER_NAME
 from argilla.client.sdk.client import AuthenticatedClient
 from argilla.client.sdk.commons.errors import (
     GenericApiError,
     NotFoundApiError,
     ValidationApiError,
 )
+from argilla.client.sdk.datasets import api as datasets_api
 from argilla.client.sdk.datasets.api import _build_response, get_dataset
 from argilla.client.sdk.datasets.models import Dataset
 from argilla.client.sdk.text_classification.models import TextClassificationBulkData
@@ -32,7 +33,7 @@ def sdk_client():
 
 
 def test_get_dataset(mocked_client, sdk_client, monkeypatch):
-    monkeypatch.setattr(httpx, "get", mocked_client.get)
+    monkeypatch.setattr(sdk_client, "__httpx__", mocked_client)
 
     # create test dataset
     bulk_data = TextClassificationBulkData(records=[])
@@ -49,6 +50,66 @@ def test_get_dataset(mocked_client, sdk_client, monkeypatch):
     assert isinstance(response.parsed, Dataset)
 
 
+class _MockedHttpxClient:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        return httpx.Response(
+            status_code=200,
+            json={"id": "mock-ds", "name": "mock-ds", "task": "TextClassification"},
+        )
+
+
+@pytest.fixture
+def mocked_httpx_client(sdk_client, monkeypatch):
+    httpx_client = _MockedHttpxClient()
+    monkeypatch.setattr(sdk_client, "__httpx__", httpx_client)
+
+    datasets_api.clear_datasets_cache()
+    yield httpx_client
+    datasets_api.clear_datasets_cache()
+
+
+def test_get_dataset_cache_expiration(sdk_client, mocked_httpx_client, monkeypatch):
+    get_dataset(client=sdk_client, name="mock-ds")
+    get_dataset(client=sdk_client, name="mock-ds")
+    assert len(mocked_httpx_client.calls) == 1
+    assert datasets_api.get_datasets_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    monkeypatch.setattr(datasets_api, "_CACHE_TTL", 0)
+    get_dataset(client=sdk_client, name="mock-ds")
+    assert len(mocked_httpx_client.calls) == 2
+    assert datasets_api.get_datasets_cache_stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_get_dataset_cache_evicts_oldest_entry(sdk_client, mocked_httpx_client, monkeypatch):
+    monkeypatch.setattr(datasets_api, "_CACHE_MAX_SIZE", 2)
+
+    for name in ["ds-a", "ds-b", "ds-c"]:
+        get_dataset(client=sdk_client, name=name)
+    assert datasets_api.get_datasets_cache_stats()["size"] == 2
+
+    get_dataset(client=sdk_client, name="ds-c")
+    assert len(mocked_httpx_client.calls) == 3
+
+    get_dataset(client=sdk_client, name="ds-a")
+    assert len(mocked_httpx_client.calls) == 4
+
+
+def test_get_dataset_cache_by_workspace(sdk_client, mocked_httpx_client, monkeypatch):
+    monkeypatch.setitem(sdk_client.headers, WORKSPACE_HEADER_NAME, "workspace-a")
+    get_dataset(client=sdk_client, name="mock-ds")
+    get_dataset(client=sdk_client, name="mock-ds")
+    assert len(mocked_httpx_client.calls) == 1
+
+    monkeypatch.setitem(sdk_client.headers, WORKSPACE_HEADER_NAME, "workspace-b")
+    get_dataset(client=sdk_client, name="mock-ds")
+    assert len(mocked_httpx_client.calls) == 2
+    assert datasets_api.get_datasets_cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
 @pytest.mark.parametrize(
     "status_code, expected",
     [
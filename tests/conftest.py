@@ -27,6 +27,7 @@ from argilla.server.database import SessionLocal
 from argilla.server.models import User, UserRole, Workspace, WorkspaceUser
 from starlette.testclient import TestClient
 
+from .client.conftest import is_vector_search_supported
 from .factories import AnnotatorFactory
 from .helpers import SecuredClient
 
@@ -133,36 +134,50 @@ def api():
     return Argilla()
 
 
+@pytest.fixture(scope="session")
+def mocked_test_client():
+    # Shared by all mocked clients, so the app startup only runs once per session
+    with TestClient(app, raise_server_exceptions=False) as client:
+        yield client
+
+
+@pytest.fixture
+def requires_vector_search():
+    # Probed when a test asks for it, instead of when the test modules are imported
+    if not is_vector_search_supported():
+        pytest.skip("Vector search not supported")
+
+
 @pytest.fixture
 def mocked_client(
     db,
     monkeypatch,
     telemetry_track_data,
     argilla_user,
+    mocked_test_client,
 ) -> SecuredClient:
-    with TestClient(app, raise_server_exceptions=False) as _client:
-        client_ = SecuredClient(_client)
+    client_ = SecuredClient(mocked_test_client)
 
-        real_whoami = users_api.whoami
+    real_whoami = users_api.whoami
 
-        def whoami_mocked(client):
-            monkeypatch.setattr(client, "__httpx__", client_)
-            return real_whoami(client)
+    def whoami_mocked(client):
+        monkeypatch.setattr(client, "__httpx__", client_)
+        return real_whoami(client)
 
-        monkeypatch.setattr(users_api, "whoami", whoami_mocked)
+    monkeypatch.setattr(users_api, "whoami", whoami_mocked)
 
-        monkeypatch.setattr(httpx, "post", client_.post)
-        monkeypatch.setattr(httpx, "patch", client_.patch)
-        monkeypatch.setattr(httpx.AsyncClient, "post", client_.post_async)
-        monkeypatch.setattr(httpx, "get", client_.get)
-        monkeypatch.setattr(httpx, "delete", client_.delete)
-        monkeypatch.setattr(httpx, "put", client_.put)
-        monkeypatch.setattr(httpx, "stream", client_.stream)
+    monkeypatch.setattr(httpx, "post", client_.post)
+    monkeypatch.setattr(httpx, "patch", client_.patch)
+    monkeypatch.setattr(httpx.AsyncClient, "post", client_.post_async)
+    monkeypatch.setattr(httpx, "get", client_.get)
+    monkeypatch.setattr(httpx, "delete", client_.delete)
+    monkeypatch.setattr(httpx, "put", client_.put)
+    monkeypatch.setattr(httpx, "stream", client_.stream)
 
-        rb_api = active_api()
-        monkeypatch.setattr(rb_api._client, "__httpx__", client_)
+    rb_api = active_api()
+    monkeypatch.setattr(rb_api._client, "__httpx__", client_)
 
-        yield client_
+    yield client_
 
 
 @pytest.fixture
@@ -27,7 +27,6 @@ from argilla.server.security.model import WorkspaceCreate, WorkspaceUserCreate
 from argilla.server.settings import settings
 from sqlalchemy.orm import Session
 
-from tests.client.conftest import SUPPORTED_VECTOR_SEARCH
 from tests.helpers import SecuredClient
 
 
@@ -77,10 +76,7 @@ def test_delete_and_create_for_different_task(mocked_client):
     rg.load(dataset)
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 def test_similarity_search_in_python_client(
     mocked_client: SecuredClient,
 ):
@@ -130,10 +126,7 @@ def test_similarity_search_in_python_client(
         )
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 def test_log_data_with_vectors_and_update_ok(
     mocked_client: SecuredClient,
 ):
@@ -167,10 +160,7 @@ def test_log_data_with_vectors_and_update_ok(
     assert ds[0].id == 3
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 def test_log_data_with_vectors_and_update_ko(mocked_client: SecuredClient):
     dataset = "test_log_data_with_vectors_and_update_ko"
     text = "This is a text"
@@ -20,7 +20,6 @@ from argilla.metrics import __all__ as ALL_METRICS
 from argilla.metrics import entity_consistency
 from datasets import load_dataset
 
-from tests.client.conftest import SUPPORTED_VECTOR_SEARCH
 from tests.helpers import SecuredClient
 
 
@@ -468,10 +467,7 @@ def test_search_keywords(mocked_client, api):
     assert {"listened", "listen"} == top_keywords, top_keywords
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 def test_log_data_with_vectors_and_update_ok(mocked_client: SecuredClient, api):
     dataset = "test_log_data_with_vectors_and_update_ok"
     text = "This is a text"
@@ -519,10 +515,7 @@ def test_logging_data_with_concurrency(mocked_client):
     assert len(dataset_ds) == len(ds)
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 def test_log_data_with_vectors_and_partial_update_ok(mocked_client: SecuredClient, api):
     dataset = "test_log_data_and_partial_update_ok"
     text = "This is a text"
@@ -21,8 +21,6 @@ from argilla.server.apis.v0.models.text2text import (
     Text2TextSearchResults,
 )
 
-from tests.client.conftest import SUPPORTED_VECTOR_SEARCH
-
 
 def test_search_records(mocked_client):
     dataset = "test_search_records"
@@ -110,10 +108,7 @@ def search_data(
             assert vector_name in record.vectors
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 def test_search_with_vectors(mocked_client):
     dataset = "test_search_with_vectors"
 
@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 from datetime import datetime
+from functools import lru_cache
 
 import pytest
 from argilla.server.apis.v0.models.commons.model import BulkResponse
@@ -28,7 +29,26 @@ from argilla.server.apis.v0.models.text_classification import (
 from argilla.server.commons.models import PredictionStatus
 from argilla.server.schemas.datasets import Dataset
 
-from tests.client.conftest import SUPPORTED_VECTOR_SEARCH
+
+@lru_cache(maxsize=1)
+def _predicted_record() -> TextClassificationRecord:
+    # Validated once and then copied with `.copy(update=...)`, which skips validation
+    return TextClassificationRecord(
+        id=0,
+        inputs={"data": "my data"},
+        prediction={
+            "agent": "test",
+            "labels": [
+                {"class": "Test", "score": 0.3},
+                {"class": "Mocking", "score": 0.7},
+            ],
+        },
+    )
+
+
+def _ids(response) -> list:
+    # Reads record ids straight from the search response, without parsing the records
+    return [record["id"] for record in response.json()["records"]]
 
 
 def test_create_records_for_text_classification_with_multi_label(mocked_client):
@@ -75,13 +95,15 @@ def test_create_records_for_text_classification_with_multi_label(mocked_client):
             },
         ]
     ]
+    # Both bulk requests send the same records, so they are only serialized once
+    records_data = [record.dict(by_alias=True) for record in records]
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
-        json=TextClassificationBulkRequest(
-            tags={"env": "test", "class": "text classification"},
-            metadata={"config": {"the": "config"}},
-            records=records,
-        ).dict(by_alias=True),
+        json={
+            "tags": {"env": "test", "class": "text classification"},
+            "metadata": {"config": {"the": "config"}},
+            "records": records_data,
+        },
     )
 
     assert response.status_code == 200, response.json()
@@ -92,11 +114,11 @@ def test_create_records_for_text_classification_with_multi_label(mocked_client):
 
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
-        json=TextClassificationBulkRequest(
-            tags={"new": "tag"},
-            metadata={"new": {"metadata": "value"}},
-            records=records,
-        ).dict(by_alias=True),
+        json={
+            "tags": {"new": "tag"},
+            "metadata": {"new": {"metadata": "value"}},
+            "records": records_data,
+        },
     )
 
     get_dataset = Dataset.parse_obj(mocked_client.get(f"/api/datasets/{dataset}").json())
@@ -159,7 +181,7 @@ def test_create_records_for_text_classification(mocked_client, telemetry_track_d
     )
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
-        json=classification_bulk.dict(by_alias=True),
+        data=classification_bulk.json(by_alias=True),
     )
 
     assert response.status_code == 200
@@ -196,10 +218,7 @@ def test_create_records_for_text_classification(mocked_client, telemetry_track_d
     telemetry_track_data.assert_called_once()
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 def test_create_records_for_text_classification_vector_search(mocked_client, telemetry_track_data):
     dataset = "test_create_records_for_text_classification_vector_search"
     assert mocked_client.delete(f"/api/datasets/{dataset}").status_code == 200
@@ -252,7 +271,7 @@ def test_create_records_for_text_classification_vector_search(mocked_client, tel
     )
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
-        json=classification_bulk.dict(by_alias=True),
+        data=classification_bulk.json(by_alias=True),
     )
 
     assert response.status_code == 200
@@ -331,7 +350,7 @@ def test_partial_record_update(mocked_client):
 
     response = mocked_client.post(
         f"/api/datasets/{name}/TextClassification:bulk",
-        json=bulk.dict(by_alias=True),
+        data=bulk.json(by_alias=True),
     )
 
     assert response.status_code == 200, response.json()
@@ -350,7 +369,7 @@ def test_partial_record_update(mocked_client):
 
     mocked_client.post(
         f"/api/datasets/{name}/TextClassification:bulk",
-        json=bulk.dict(by_alias=True),
+        data=bulk.json(by_alias=True),
     )
 
     response = mocked_client.post(
@@ -389,56 +408,42 @@ def test_partial_record_update(mocked_client):
 def test_sort_by_last_updated(mocked_client):
     dataset = "test_sort_by_last_updated"
     assert mocked_client.delete(f"/api/datasets/{dataset}").status_code == 200
+    bulk_data = TextClassificationBulkRequest(
+        records=[
+            TextClassificationRecord.construct(id=0, inputs={"data": "my data"}, metadata={"s": "value"}),
+        ],
+    ).dict(by_alias=True)
     for i in range(0, 10):
-        mocked_client.post(
-            f"/api/datasets/{dataset}/TextClassification:bulk",
-            json=TextClassificationBulkRequest(
-                records=[
-                    TextClassificationRecord(
-                        **{
-                            "id": i,
-                            "inputs": {"data": "my data"},
-                            "metadata": {"s": "value"},
-                        }
-                    )
-                ],
-            ).dict(by_alias=True),
-        )
+        # Records are sent one by one, so each one gets a later last_updated value
+        bulk_data["records"][0]["id"] = i
+        mocked_client.post(f"/api/datasets/{dataset}/TextClassification:bulk", json=bulk_data)
 
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:search?from=0&limit=10",
         json={"sort": [{"id": "last_updated", "order": "asc"}]},
     )
 
-    assert [r["id"] for r in response.json()["records"]] == list(range(0, 10))
+    assert _ids(response) == list(range(0, 10))
 
 
 def test_sort_by_id_as_default(mocked_client):
     dataset = "test_sort_by_id_as_default"
     assert mocked_client.delete(f"/api/datasets/{dataset}").status_code == 200
+    # Records are only serialized, so they can safely share the same inputs and metadata
+    inputs, metadata = {"data": "my data"}, {"s": "value"}
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
-        json=TextClassificationBulkRequest(
-            records=[
-                TextClassificationRecord(
-                    **{
-                        "id": i,
-                        "inputs": {"data": "my data"},
-                        "metadata": {"s": "value"},
-                    }
-                )
-                for i in range(0, 100)
-            ],
-        ).dict(by_alias=True),
+        data=TextClassificationBulkRequest(
+            records=[TextClassificationRecord.construct(id=i, inputs=inputs, metadata=metadata) for i in range(0, 100)],
+        ).json(by_alias=True),
     )
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:search?from=0&limit=10",
         json={},
     )
 
-    results = TextClassificationSearchResults.parse_obj(response.json())
-    assert results.total == 100
-    assert list(map(lambda r: r.id, results.records)) == [
+    assert response.json()["total"] == 100
+    assert _ids(response) == [
         0,
         1,
         10,
@@ -457,23 +462,20 @@ def test_some_sort_by(mocked_client):
 
     expected_records_length = 50
     assert mocked_client.delete(f"/api/datasets/{dataset}").status_code == 200
+    inputs = {"data": "my data"}
     mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
-        json=TextClassificationBulkRequest(
+        data=TextClassificationBulkRequest(
             records=[
-                TextClassificationRecord(
-                    **{
-                        "id": i,
-                        "inputs": {"data": "my data"},
-                        "prediction": {"agent": f"agent_{i%5}", "labels": []},
-                        "metadata": {
-                            "s": f"{i} value",
-                        },
-                    }
+                TextClassificationRecord.construct(
+                    id=i,
+                    inputs=inputs,
+                    prediction={"agent": f"agent_{i%5}", "labels": []},
+                    metadata={"s": f"{i} value"},
                 )
                 for i in range(0, expected_records_length)
             ],
-        ).dict(by_alias=True),
+        ).json(by_alias=True),
     )
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:search?from=0&limit=10",
@@ -513,9 +515,8 @@ def test_some_sort_by(mocked_client):
         },
     )
 
-    results = TextClassificationSearchResults.parse_obj(response.json())
-    assert results.total == expected_records_length
-    assert list(map(lambda r: r.id, results.records)) == [
+    assert response.json()["total"] == expected_records_length
+    assert _ids(response) == [
         14,
         19,
         24,
@@ -535,26 +536,11 @@ def test_disable_aggregations_when_scroll(mocked_client):
 
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
-        json=TextClassificationBulkRequest(
+        data=TextClassificationBulkRequest(
             tags={"env": "test", "class": "text classification"},
             metadata={"config": {"the": "config"}},
-            records=[
-                TextClassificationRecord(
-                    **{
-                        "id": i,
-                        "inputs": {"data": "my data"},
-                        "prediction": {
-                            "agent": "test",
-                            "labels": [
-                                {"class": "Test", "score": 0.3},
-                                {"class": "Mocking", "score": 0.7},
-                            ],
-                        },
-                    }
-                )
-                for i in range(0, 100)
-            ],
-        ).dict(by_alias=True),
+            records=[_predicted_record().copy(update={"id": i}) for i in range(0, 100)],
+        ).json(by_alias=True),
     )
     bulk_response = BulkResponse.parse_obj(response.json())
     assert bulk_response.processed == 100
@@ -564,36 +550,23 @@ def test_disable_aggregations_when_scroll(mocked_client):
         json={},
     )
 
-    results = TextClassificationSearchResults.parse_obj(response.json())
-    assert results.total == 100
-    assert results.aggregations is None
+    results = response.json()
+    assert results["total"] == 100
+    assert results.get("aggregations") is None
 
 
 def test_include_event_timestamp(mocked_client):
     dataset = "test_include_event_timestamp"
     assert mocked_client.delete(f"/api/datasets/{dataset}").status_code == 200
 
+    event_timestamp = datetime.utcnow()
     response = mocked_client.post(
         f"/api/datasets/{dataset}/TextClassification:bulk",
         data=TextClassificationBulkRequest(
             tags={"env": "test", "class": "text classification"},
             metadata={"config": {"the": "config"}},
             records=[
-                TextClassificationRecord(
-                    **{
-                        "id": i,
-                        "inputs": {"data": "my data"},
-                        "event_timestamp": datetime.utcnow(),
-                        "prediction": {
-                            "agent": "test",
-                            "labels": [
-                                {"class": "Test", "score": 0.3},
-                                {"class": "Mocking", "score": 0.7},
-                            ],
-                        },
-                    }
-                )
-                for i in range(0, 100)
+                _predicted_record().copy(update={"id": i, "event_timestamp": event_timestamp}) for i in range(0, 100)
             ],
         ).json(by_alias=True),
     )
@@ -605,9 +578,9 @@ def test_include_event_timestamp(mocked_client):
         json={},
     )
 
-    results = TextClassificationSearchResults.parse_obj(response.json())
-    assert results.total == 100
-    assert all(map(lambda record: record.event_timestamp is not None, results.records))
+    results = response.json()
+    assert results["total"] == 100
+    assert all(record.get("event_timestamp") is not None for record in results["records"])
 
 
 def test_words_cloud(mocked_client):
@@ -24,8 +24,6 @@ from argilla.server.apis.v0.models.token_classification import (
     TokenClassificationSearchResults,
 )
 
-from tests.client.conftest import SUPPORTED_VECTOR_SEARCH
-
 
 def test_load_as_different_task(mocked_client):
     dataset = "test_load_as_different_task"
@@ -216,10 +214,7 @@ def test_create_records_for_token_classification(mocked_client, include_metrics:
         assert metrics_validator(record)
 
 
-@pytest.mark.skipif(
-    condition=not SUPPORTED_VECTOR_SEARCH,
-    reason="Vector search not supported",
-)
+@pytest.mark.usefixtures("requires_vector_search")
 @pytest.mark.parametrize(
     ("include_metrics", "metrics_validator"),
     [